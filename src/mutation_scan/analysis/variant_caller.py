@@ -23,6 +23,7 @@ ANTI-HALLUCINATION RULES:
 import importlib
 import inspect
 import logging
+import os
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -105,6 +106,7 @@ class VariantCaller:
         
         # Load resistance database and drug mapping
         self.resistance_db = self._load_resistance_db()
+        self._resistance_index = self._index_resistance_db()
         self.drug_mapping = self._load_drug_mapping()
 
         # ML predictor settings (Module 6)
@@ -114,6 +116,8 @@ class VariantCaller:
         self.min_identity_percent = float(min_identity_percent)
         self._ml_predictor = None
         self._ml_predictor_error: Optional[Exception] = None
+        # Parsed wild-type references, reused across every genome's protein file
+        self._reference_cache: Dict[Path, SeqRecord] = {}
         
         # Initialize PairwiseAligner with BLOSUM62
         self.aligner = PairwiseAligner()
@@ -172,6 +176,23 @@ class VariantCaller:
             logger.error(f"Failed to load resistance DB: {e}")
             return {}
 
+    def _index_resistance_db(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        Index resistance database entries by gene and mutation string.
+
+        The first entry listed for a mutation wins, matching a linear scan
+        of the gene's entry list.
+
+        Returns:
+            Dictionary mapping gene -> {mutation: entry}
+        """
+        index: Dict[str, Dict[str, Dict]] = {}
+        for gene, entries in self.resistance_db.items():
+            by_mutation = index.setdefault(gene, {})
+            for entry in entries:
+                by_mutation.setdefault(entry.get('mutation'), entry)
+        return index
+
     def _load_drug_mapping(self) -> Dict[str, str]:
         """
         Load gene-to-drug mapping from JSON configuration file.
@@ -263,6 +284,9 @@ class VariantCaller:
         
         logger.info(f"Processing {len(faa_files)} protein files")
         
+        # Resolve reference paths once instead of stat-ing per protein file
+        ref_index = self._index_references()
+        
         all_mutations = []
         
         for faa_file in faa_files:
@@ -280,7 +304,9 @@ class VariantCaller:
                 accession, gene_name = parts
                 
                 # Call variants for this protein
-                mutations = self._call_variants_single(faa_file, accession, gene_name)
+                mutations = self._call_variants_single(
+                    faa_file, accession, gene_name, ref_index=ref_index
+                )
                 all_mutations.extend(mutations)
                 
             except Exception as e:
@@ -316,7 +342,8 @@ class VariantCaller:
         self,
         faa_file: Path,
         accession: str,
-        gene_name: str
+        gene_name: str,
+        ref_index: Optional[Dict[str, Path]] = None
     ) -> List[Dict]:
         """
         Call variants for a single protein file.
@@ -325,20 +352,29 @@ class VariantCaller:
             faa_file: Path to .faa file
             accession: Genome accession
             gene_name: Gene name
+            ref_index: Optional gene -> reference path map from _index_references()
 
         Returns:
             List of mutation dictionaries
         """
         # Load wild-type reference
-        ref_file = self.refs_dir / f"{gene_name}_WT.faa"
+        if ref_index is None:
+            ref_index = self._index_references()
+        ref_file = ref_index.get(gene_name)
         
-        if not ref_file.exists():
-            logger.warning(f"Wild-type reference not found for {gene_name}: {ref_file}. Skipping.")
+        if ref_file is None:
+            logger.warning(
+                f"Wild-type reference not found for {gene_name}: "
+                f"{self.refs_dir / f'{gene_name}_WT.faa'}. Skipping."
+            )
             return []
         
         try:
-            # Load reference sequence
-            ref_record = self._load_sequence_record(ref_file, f"{gene_name}_WT")
+            # Load reference sequence (parsed once per gene)
+            ref_record = self._reference_cache.get(ref_file)
+            if ref_record is None:
+                ref_record = self._load_sequence_record(ref_file, f"{gene_name}_WT")
+                self._reference_cache[ref_file] = ref_record
             
             # Load query sequence
             query_record = self._load_sequence_record(faa_file, f"{accession}_{gene_name}")
@@ -450,15 +486,17 @@ class VariantCaller:
             # Perform global alignment
             # CRITICAL: Order matters! align(reference.seq, query.seq) NOT align(query.seq, reference.seq)
             # alignment[0] = reference, alignment[1] = query
-            alignments = list(self.aligner.align(reference.seq, query.seq))
+            # The aligner enumerates co-optimal alignments lazily; their number can
+            # grow combinatorially, so take the first one instead of list()-ing them all
+            alignments = self.aligner.align(reference.seq, query.seq)
             
-            if not alignments:
+            # Take best alignment (first one, highest score)
+            alignment = next(iter(alignments), None)
+            
+            if alignment is None:
                 logger.warning(f"No alignment found for {accession}_{gene_name}")
                 return []
             
-            # Take best alignment (first one, highest score)
-            alignment = alignments[0]
-            
             # Extract aligned sequences
             # alignment[0] = reference (target in Biopython terminology)
             # alignment[1] = query
@@ -470,10 +508,27 @@ class VariantCaller:
                 logger.error(f"Alignment length mismatch for {accession}_{gene_name}")
                 return []
             
+            # Single pass over the alignment columns: count identities and reference
+            # length, and collect substitutions using the Residue Counter Algorithm
+            identities = 0
+            reference_position = 0  # Will increment to 1 on first non-gap residue
+            substitutions = []
+            
+            for ref_aa, query_aa in zip(aligned_ref, aligned_query):
+                # Reference gaps carry no position, identity or substitution
+                if ref_aa == '-':
+                    continue
+                reference_position += 1
+                
+                if ref_aa == query_aa:
+                    identities += 1
+                elif query_aa != '-':
+                    # Reference and Query differ and neither is a gap
+                    substitutions.append(f"{ref_aa}{reference_position}{query_aa}")
+            
             # Log alignment quality
             score = alignment.score
-            identities = sum(1 for a, b in zip(aligned_query, aligned_ref) if a == b and a != '-')
-            length = len(aligned_ref.replace('-', ''))  # Reference length without gaps
+            length = reference_position  # Reference length without gaps
             identity_percent = (identities / length) * 100 if length > 0 else 0
             
             logger.info(f"Alignment {accession}_{gene_name}: Score={score:.1f}, Identity={identity_percent:.1f}%")
@@ -488,44 +543,26 @@ class VariantCaller:
                 )
                 return []
             
-            # Call mutations using Residue Counter Algorithm
             mutations = []
-            reference_position = 0  # Will increment to 1 on first non-gap residue
-            
-            for i in range(len(aligned_ref)):
-                ref_aa = aligned_ref[i]
-                query_aa = aligned_query[i]
+            for mutation_str in substitutions:
+                # Interpret mutation
+                status, phenotype, pdb, prediction_score, prediction_source = self._interpret_mutation(
+                    gene_name,
+                    mutation_str
+                )
                 
-                # Increment position counter ONLY if reference is not a gap
-                if ref_aa != '-':
-                    reference_position += 1
+                mutations.append({
+                    'Accession': accession,
+                    'Gene': gene_name,
+                    'Mutation': mutation_str,
+                    'Status': status,
+                    'Phenotype': phenotype,
+                    'Reference_PDB': pdb,
+                    'prediction_score': prediction_score,
+                    'prediction_source': prediction_source
+                })
                 
-                # Check for substitution
-                # Conditions:
-                # 1. Reference and Query are different
-                # 2. Reference is NOT a gap (we have a real position)
-                # 3. Query is NOT a gap (we have a real amino acid)
-                if ref_aa != query_aa and ref_aa != '-' and query_aa != '-':
-                    mutation_str = f"{ref_aa}{reference_position}{query_aa}"
-                    
-                    # Interpret mutation
-                    status, phenotype, pdb, prediction_score, prediction_source = self._interpret_mutation(
-                        gene_name,
-                        mutation_str
-                    )
-                    
-                    mutations.append({
-                        'Accession': accession,
-                        'Gene': gene_name,
-                        'Mutation': mutation_str,
-                        'Status': status,
-                        'Phenotype': phenotype,
-                        'Reference_PDB': pdb,
-                        'prediction_score': prediction_score,
-                        'prediction_source': prediction_source
-                    })
-                    
-                    logger.debug(f"Found mutation: {mutation_str} ({status})")
+                logger.debug(f"Found mutation: {mutation_str} ({status})")
             
             logger.info(f"Identified {len(mutations)} mutations in {accession}_{gene_name}")
             
@@ -562,30 +599,29 @@ class VariantCaller:
             - prediction_source: "Clinical DB" or "AI Model"
         """
         # Check if gene exists in resistance DB
-        if gene_name not in self.resistance_db:
+        gene_mutations = self._resistance_index.get(gene_name)
+        if gene_mutations is None:
             return self._fallback_to_ml(gene_name, mutation)
         
         # Check if mutation exists for this gene
-        gene_mutations = self.resistance_db[gene_name]
-        
-        for entry in gene_mutations:
-            if entry.get('mutation') == mutation:
-                # Use phenotype from DB if available, else construct from drug mapping
-                db_phenotype = entry.get('phenotype')
-                if db_phenotype:
-                    phenotype = db_phenotype
-                else:
-                    # Construct phenotype from drug mapping
-                    drug = self.drug_mapping.get(gene_name.lower(), "Unknown drug")
-                    phenotype = f"{drug} resistance"
-                
-                return (
-                    "Resistant",
-                    phenotype,
-                    entry.get('pdb', 'N/A'),
-                    1.0,
-                    "Clinical DB"
-                )
+        entry = gene_mutations.get(mutation)
+        if entry is not None:
+            # Use phenotype from DB if available, else construct from drug mapping
+            db_phenotype = entry.get('phenotype')
+            if db_phenotype:
+                phenotype = db_phenotype
+            else:
+                # Construct phenotype from drug mapping
+                drug = self.drug_mapping.get(gene_name.lower(), "Unknown drug")
+                phenotype = f"{drug} resistance"
+            
+            return (
+                "Resistant",
+                phenotype,
+                entry.get('pdb', 'N/A'),
+                1.0,
+                "Clinical DB"
+            )
         
         # Mutation not in database, try ML
         return self._fallback_to_ml(gene_name, mutation)
@@ -731,6 +767,21 @@ class VariantCaller:
             logger.warning(f"ML prediction failed for {mutation}: {e}")
             return {"success": False, "error": str(e)}
 
+    def _index_references(self) -> Dict[str, Path]:
+        """
+        Map gene names to wild-type reference files with one directory scan.
+
+        Returns:
+            Dictionary mapping gene name -> {GeneName}_WT.faa path
+        """
+        suffix = "_WT.faa"
+        with os.scandir(self.refs_dir) as entries:
+            return {
+                entry.name[:-len(suffix)]: Path(entry.path)
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file()
+            }
+
     def get_available_references(self) -> List[str]:
         """
         Get list of available wild-type references.
@@ -738,8 +789,7 @@ class VariantCaller:
         Returns:
             List of gene names (without _WT.faa suffix)
         """
-        ref_files = list(self.refs_dir.glob("*_WT.faa"))
-        gene_names = [f.stem.replace('_WT', '') for f in ref_files]
+        gene_names = list(self._index_references())
         
         logger.info(f"Found {len(gene_names)} wild-type references: {gene_names}")
         return gene_names
@@ -6,8 +6,10 @@ and housekeeping genes (via local BLASTn) from bacterial genome sequences.
 """
 
 import logging
+import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from pathlib import Path
 from typing import Optional, List
@@ -16,6 +18,18 @@ import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+_HOME = Path.home()
+
+# ABRicate locations probed in order; resolved once at import
+ABRICATE_CANDIDATES = (
+    'abricate',  # In PATH
+    'wsl abricate',  # WSL installation
+    '/usr/local/bin/abricate',  # System install
+    str(_HOME / 'miniconda3' / 'bin' / 'abricate'),  # Miniconda
+    str(_HOME / 'miniconda3' / 'envs' / 'abricate-env' / 'bin' / 'abricate'),  # Conda env
+    str(_HOME / 'anaconda3' / 'bin' / 'abricate'),  # Anaconda
+)
+
 
 class GeneFinder:
     """
@@ -81,6 +95,7 @@ class GeneFinder:
         self.abricate_db = abricate_db
         self.target_genes = [g.lower() for g in target_genes] if target_genes else None
         self.abricate_path = self._find_abricate()
+        self._blastn_available: Optional[bool] = None
         
         if not self.abricate_path:
             raise EnvironmentError(
@@ -100,19 +115,13 @@ class GeneFinder:
         Returns:
             Path to abricate executable, or None if not found
         """
-        possible_paths = [
-            'abricate',  # In PATH
-            'wsl abricate',  # WSL installation
-            '/usr/local/bin/abricate',  # System install
-            Path.home() / 'miniconda3' / 'bin' / 'abricate',  # Miniconda
-            Path.home() / 'miniconda3' / 'envs' / 'abricate-env' / 'bin' / 'abricate',  # Conda env
-            Path.home() / 'anaconda3' / 'bin' / 'abricate',  # Anaconda
-        ]
-
-        for path in possible_paths:
+        for path_str in ABRICATE_CANDIDATES:
+            cmd = path_str.split() + ['--version']
+            # Cheap PATH/stat lookup first; shutil.which also rejects directories,
+            # so missing candidates never cost a fork+exec
+            if shutil.which(cmd[0]) is None:
+                continue
             try:
-                path_str = str(path) if isinstance(path, Path) else path
-                cmd = path_str.split() + ['--version']
                 result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
                 if result.returncode == 0:
                     logger.debug(f"Found ABRicate at: {path_str}")
@@ -308,17 +317,25 @@ class GeneFinder:
             return self._empty_dataframe()
 
     def _check_blastn(self) -> bool:
-        """Check if blastn is available in PATH."""
-        try:
-            result = subprocess.run(
-                ['blastn', '-version'], 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
-            return False
+        """Check if blastn is available in PATH (probed once per GeneFinder)."""
+        if self._blastn_available is not None:
+            return self._blastn_available
+
+        available = False
+        if shutil.which('blastn') is not None:
+            try:
+                result = subprocess.run(
+                    ['blastn', '-version'], 
+                    capture_output=True, 
+                    text=True, 
+                    timeout=10
+                )
+                available = result.returncode == 0
+            except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+                available = False
+
+        self._blastn_available = available
+        return available
 
     def _parse_blastn_output(
         self, 
@@ -409,18 +426,21 @@ class GeneFinder:
         """
         logger.info(f"Running hybrid gene detection on {fasta_file.name}")
         
-        # Find resistance genes
-        resistance_df = self.find_resistance_genes(fasta_file)
-        
         # Find housekeeping genes if reference provided
         if reference_db and Path(reference_db).exists():
-            housekeeping_df = self.find_housekeeping_genes(fasta_file, reference_db)
+            # ABRicate and BLASTn are independent external processes, so run BLASTn
+            # in a worker thread while ABRicate runs here
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                housekeeping_future = pool.submit(self.find_housekeeping_genes, fasta_file, reference_db)
+                resistance_df = self.find_resistance_genes(fasta_file)
+                housekeeping_df = housekeeping_future.result()
             
             # Combine results
             combined_df = pd.concat([resistance_df, housekeeping_df], ignore_index=True)
             logger.info(f"Total genes found: {len(combined_df)}")
             return combined_df
         else:
+            resistance_df = self.find_resistance_genes(fasta_file)
             logger.info(f"Total genes found: {len(resistance_df)} (resistance only)")
             return resistance_df
 
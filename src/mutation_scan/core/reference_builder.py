@@ -7,6 +7,7 @@ always take priority over auto-fetched sequences.
 """
 
 import logging
+import os
 import time
 from pathlib import Path
 from typing import Optional
@@ -35,6 +36,8 @@ class ReferenceBuilder:
         Args:
             email: Email for NCBI (required by NCBI policy)
             api_key: Optional NCBI API key for higher rate limits
+                     (defaults to the NCBI_API_KEY environment variable).
+                     With a key Entrez allows 10 requests/s instead of 3.
             
         Raises:
             ValueError: If email is not provided
@@ -43,14 +46,17 @@ class ReferenceBuilder:
             raise ValueError("Email is required for NCBI API access")
         
         self.email = email
-        self.api_key = api_key
+        self.api_key = api_key or os.environ.get("NCBI_API_KEY")
         
         # Configure Entrez
         Entrez.email = self.email
         if self.api_key:
             Entrez.api_key = self.api_key
         
-        logger.info(f"Initialized ReferenceBuilder for {email}")
+        logger.info(
+            f"Initialized ReferenceBuilder for {email} "
+            f"(API key: {'yes, 10 req/s' if self.api_key else 'no, 3 req/s'})"
+        )
     
     def fetch_reference(
         self,
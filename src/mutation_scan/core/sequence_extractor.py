@@ -12,6 +12,7 @@ CRITICAL COORDINATE SYSTEM NOTES:
 """
 
 import logging
+import os
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -22,6 +23,9 @@ from Bio.SeqRecord import SeqRecord
 
 logger = logging.getLogger(__name__)
 
+# Genome FASTA extensions recognised in genomes_dir
+FASTA_SUFFIXES = (".fasta", ".fna", ".fa")
+
 
 class SequenceExtractor:
     """
@@ -84,12 +88,13 @@ class SequenceExtractor:
         Raises:
             FileNotFoundError: If genome FASTA file not found
         """
-        # Locate genome FASTA file
-        fasta_file = self.genomes_dir / f"{accession}.fasta"
+        # Locate genome FASTA file (any recognised extension)
+        fasta_file = self._find_genome_fasta(accession)
         
-        if not fasta_file.exists():
-            logger.error(f"Genome FASTA not found: {fasta_file}")
-            raise FileNotFoundError(f"Genome FASTA not found: {fasta_file}")
+        if fasta_file is None:
+            expected = self.genomes_dir / f"{accession}{{{','.join(FASTA_SUFFIXES)}}}"
+            logger.error(f"Genome FASTA not found: {expected}")
+            raise FileNotFoundError(f"Genome FASTA not found: {expected}")
         
         # Ensure output directory exists
         output_dir = Path(output_dir)
@@ -362,6 +367,22 @@ class SequenceExtractor:
         
         return results
 
+    def _find_genome_fasta(self, accession: str) -> Optional[Path]:
+        """
+        Locate the genome FASTA for an accession.
+
+        Args:
+            accession: Genome accession (filename stem)
+
+        Returns:
+            Path to the first existing file among FASTA_SUFFIXES, or None
+        """
+        for suffix in FASTA_SUFFIXES:
+            candidate = self.genomes_dir / f"{accession}{suffix}"
+            if candidate.is_file():
+                return candidate
+        return None
+
     def get_available_genomes(self) -> List[str]:
         """
         Get list of available genome accessions in genomes_dir.
@@ -369,11 +390,14 @@ class SequenceExtractor:
         Returns:
             List of accession IDs (FASTA filenames without extension)
         """
-        fasta_files = list(self.genomes_dir.glob("*.fasta")) + \
-                     list(self.genomes_dir.glob("*.fna"))
-        
-        accessions = [f.stem for f in fasta_files]
-        
+        # Single directory pass instead of one glob per extension
+        with os.scandir(self.genomes_dir) as entries:
+            accessions = sorted(
+                os.path.splitext(entry.name)[0]
+                for entry in entries
+                if entry.name.endswith(FASTA_SUFFIXES) and entry.is_file()
+            )
+
         logger.info(f"Found {len(accessions)} genomes in {self.genomes_dir}")
         return accessions
 
@@ -11,17 +11,17 @@ Workflow:
 """
 
 import logging
+import os
 import re
 import subprocess
-import tempfile
 import time
-import urllib.error
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
+import requests
 from Bio import SeqIO
 from Bio.Seq import Seq
 from Bio.SeqRecord import SeqRecord
@@ -48,6 +48,7 @@ class TblastnSequenceExtractor:
         output_dir: Path,
         tblastn_binary: str = "tblastn",
         uniprot_taxid: Optional[str] = None,
+        max_workers: int = 1,
     ):
         """
         Initialize TblastnSequenceExtractor.
@@ -58,12 +59,16 @@ class TblastnSequenceExtractor:
             output_dir: Directory for extracted protein sequences
             tblastn_binary: Path to tblastn executable (default: assume in PATH)
             uniprot_taxid: Optional UniProt Taxonomy ID for reference auto-fetching (e.g., 83333 for E. coli K-12)
+            max_workers: Number of genomes processed concurrently (default: 1).
+                         Each genome's work is tblastn subprocesses, so threads
+                         overlap them without GIL contention.
         """
         self.genomes_dir = Path(genomes_dir)
         self.refs_dir = Path(refs_dir)
         self.output_dir = Path(output_dir)
         self.tblastn_binary = tblastn_binary
         self.uniprot_taxid = uniprot_taxid
+        self.max_workers = max(1, int(max_workers))
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -104,6 +109,7 @@ class TblastnSequenceExtractor:
         self,
         genome_id: str,
         target_genes: Optional[List[str]] = None,
+        ref_files: Optional[List[Path]] = None,
     ) -> Tuple[int, int]:
         """
         Extract sequences for target genes from a clinical genome using tblastn.
@@ -118,6 +124,8 @@ class TblastnSequenceExtractor:
             genome_id: Genome identifier (e.g., 'GCF_000005845')
             target_genes: List of specific genes to extract (e.g., ['acrA', 'gyrA'])
                          If None, extract all available reference genes
+            ref_files: Pre-selected reference .faa files (from
+                       _select_reference_files). If None, refs_dir is scanned.
 
         Returns:
             Tuple of (successfully_extracted, failed)
@@ -131,24 +139,11 @@ class TblastnSequenceExtractor:
             return 0, 0
 
         # Get list of reference proteins
-        ref_files = list(self.refs_dir.glob("*.faa"))
+        if ref_files is None:
+            ref_files = self._select_reference_files(target_genes)
         if not ref_files:
-            logger.warning(f"No reference protein files found in {self.refs_dir}")
             return 0, 0
 
-        # Filter by target genes if specified
-        if target_genes:
-            target_genes_lower = [g.lower() for g in target_genes]
-            ref_files = [
-                f for f in ref_files
-                if any(tg in f.stem.lower() for tg in target_genes_lower)
-            ]
-            if not ref_files:
-                logger.warning(
-                    f"No reference files match target genes: {target_genes}"
-                )
-                return 0, 0
-
         success_count = 0
         fail_count = 0
 
@@ -189,6 +184,49 @@ class TblastnSequenceExtractor:
         )
         return success_count, fail_count
 
+    def _select_reference_files(
+        self,
+        target_genes: Optional[List[str]] = None,
+    ) -> List[Path]:
+        """
+        Scan refs_dir once and select the reference proteins to align.
+
+        Args:
+            target_genes: Optional list of genes to keep (case-insensitive)
+
+        Returns:
+            List of reference .faa paths (empty if none available/matching)
+        """
+        try:
+            with os.scandir(self.refs_dir) as entries:
+                ref_files = sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".faa") and entry.is_file()
+                )
+        except FileNotFoundError:
+            ref_files = []
+
+        if not ref_files:
+            logger.warning(f"No reference protein files found in {self.refs_dir}")
+            return []
+
+        # Filter by target genes if specified. Match the gene name exactly
+        # ({gene}_WT.faa or {gene}.faa): a substring test let e.g. "acr"
+        # pick up acrA/acrB/acrR references.
+        if target_genes:
+            target_genes_lower = {g.lower() for g in target_genes}
+            ref_files = [
+                f for f in ref_files
+                if f.stem.lower().removesuffix("_wt") in target_genes_lower
+            ]
+            if not ref_files:
+                logger.warning(
+                    f"No reference files match target genes: {target_genes}"
+                )
+
+        return ref_files
+
     def _run_tblastn_alignment(
         self,
         ref_faa: Path,
@@ -201,7 +239,7 @@ class TblastnSequenceExtractor:
         Command:
             tblastn -query <ref_faa> -subject <genome_fna> \\
               -outfmt "6 qseqid sseqid pident length mismatch gapopen qstart qend sstart send evalue bitscore sseq" \\
-              -max_target_seqs 1 -max_hsps 1 > temp_output.txt
+              -max_target_seqs 1 -max_hsps 1
 
         Output Format 6 columns:
             1. qseqid: Query sequence ID
@@ -226,11 +264,6 @@ class TblastnSequenceExtractor:
         Returns:
             Cleaned protein sequence (gaps removed) or None if no alignment
         """
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".txt", delete=False
-        ) as tmp:
-            tmp_output = tmp.name
-
         try:
             command = [
                 self.tblastn_binary,
@@ -240,20 +273,20 @@ class TblastnSequenceExtractor:
                 "6 qseqid sseqid pident length mismatch gapopen qstart qend sstart send evalue bitscore sseq",
                 "-max_target_seqs", "1",
                 "-max_hsps", "1",
-                "-out", tmp_output,
             ]
 
+            # Read the single tabular hit from stdout rather than a temp file;
+            # stdin is closed so tblastn can never block waiting for input
             result = subprocess.run(
                 command,
+                stdin=subprocess.DEVNULL,
                 capture_output=True,
                 text=True,
                 check=True,
                 timeout=60,
             )
 
-            # Parse output
-            with open(tmp_output, "r") as f:
-                content = f.read().strip()
+            content = result.stdout.strip()
 
             if not content:
                 # No alignment found
@@ -284,9 +317,6 @@ class TblastnSequenceExtractor:
         except Exception as e:
             logger.error(f"Error running tblastn for {gene_name}: {e}")
             return None
-        finally:
-            # Cleanup temp file
-            Path(tmp_output).unlink(missing_ok=True)
 
     def extract_all_genomes(
         self,
@@ -315,23 +345,32 @@ class TblastnSequenceExtractor:
             f"Starting extraction for {total} genomes across {gene_count} targets..."
         )
 
-        results = []
-        fully_successful = 0
-        partial_or_failed = 0
+        # Reference selection is identical for every genome: scan refs_dir once
+        ref_files = self._select_reference_files(target_genes)
 
-        for idx, genome_id in enumerate(genome_ids, start=1):
+        def extract_one(idx: int, genome_id: str) -> Tuple[int, int]:
             logger.info(f"[{idx}/{total}] Extracting {genome_id}...")
             try:
-                success, fail = self.extract_with_tblastn(
-                    genome_id, target_genes=target_genes
+                return self.extract_with_tblastn(
+                    genome_id, target_genes=target_genes, ref_files=ref_files
                 )
             except Exception as e:
                 # Graceful degradation: continue to next genome.
                 logger.warning(
                     f"  -> Failed to process genome {genome_id}: {e}"
                 )
-                success, fail = 0, 1
+                return 0, 1
+
+        if self.max_workers > 1:
+            logger.info(f"Running {self.max_workers} genomes in parallel")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            counts = list(pool.map(extract_one, range(1, total + 1), genome_ids))
+
+        results = []
+        fully_successful = 0
+        partial_or_failed = 0
 
+        for genome_id, (success, fail) in zip(genome_ids, counts):
             results.append({
                 "Genome": genome_id,
                 "Extracted": success,
@@ -370,36 +409,40 @@ class TblastnSequenceExtractor:
             return
         
         logger.info(f"Checking references for {len(target_genes)} genes...")
-        for gene in target_genes:
-            ref_path = self.refs_dir / f"{gene.lower()}.fasta"
-            if ref_path.exists():
-                logger.debug(f"Reference exists: {ref_path.name}")
-                continue
-            
-            logger.info(f"Reference for {gene} missing. Auto-fetching from UniProt for TaxID {self.uniprot_taxid}...")
-            try:
-                # Query UniProt for the reviewed (canonical) reference protein
-                query = f"gene:{gene}+AND+taxonomy_id:{self.uniprot_taxid}+AND+reviewed:true"
-                url = f"https://rest.uniprot.org/uniprotkb/search?query={urllib.parse.quote(query)}&format=fasta&size=1"
-                
-                req = urllib.request.Request(url, headers={'Accept': 'text/plain'})
-                with urllib.request.urlopen(req, timeout=10) as response:
-                    fasta_data = response.read().decode('utf-8').strip()
-                
-                if fasta_data:
-                    with open(ref_path, 'w') as f:
-                        f.write(fasta_data)
-                    logger.info(f"Successfully saved canonical reference for {gene} to {ref_path.name}")
-                else:
-                    logger.warning(f"Could not find Reviewed UniProt reference for {gene} (TaxID: {self.uniprot_taxid}).")
-                
-                # UniProt rate limiting (be respectful)
-                time.sleep(0.5)
+        # One session for every missing gene keeps the UniProt connection alive
+        # instead of paying a fresh TCP + TLS handshake per fetch
+        with requests.Session() as session:
+            session.headers['Accept'] = 'text/plain'
+            for gene in target_genes:
+                ref_path = self.refs_dir / f"{gene.lower()}.fasta"
+                if ref_path.exists():
+                    logger.debug(f"Reference exists: {ref_path.name}")
+                    continue
                 
-            except urllib.error.HTTPError as e:
-                logger.error(f"HTTP error fetching reference for {gene}: {e.code} {e.reason}")
-            except urllib.error.URLError as e:
-                logger.error(f"Network error fetching reference for {gene}: {e}")
-            except Exception as e:
-                logger.error(f"Failed to fetch reference for {gene}: {e}")
+                logger.info(f"Reference for {gene} missing. Auto-fetching from UniProt for TaxID {self.uniprot_taxid}...")
+                try:
+                    # Query UniProt for the reviewed (canonical) reference protein
+                    query = f"gene:{gene}+AND+taxonomy_id:{self.uniprot_taxid}+AND+reviewed:true"
+                    url = f"https://rest.uniprot.org/uniprotkb/search?query={urllib.parse.quote(query)}&format=fasta&size=1"
+                    
+                    response = session.get(url, timeout=10)
+                    response.raise_for_status()
+                    fasta_data = response.content.decode('utf-8').strip()
+                    
+                    if fasta_data:
+                        with open(ref_path, 'w') as f:
+                            f.write(fasta_data)
+                        logger.info(f"Successfully saved canonical reference for {gene} to {ref_path.name}")
+                    else:
+                        logger.warning(f"Could not find Reviewed UniProt reference for {gene} (TaxID: {self.uniprot_taxid}).")
+                    
+                    # UniProt rate limiting (be respectful)
+                    time.sleep(0.5)
+                    
+                except requests.HTTPError as e:
+                    logger.error(f"HTTP error fetching reference for {gene}: {e.response.status_code} {e.response.reason}")
+                except requests.RequestException as e:
+                    logger.error(f"Network error fetching reference for {gene}: {e}")
+                except Exception as e:
+                    logger.error(f"Failed to fetch reference for {gene}: {e}")
 
@@ -5,6 +5,7 @@ Provides common file operations like reading, writing, and validation.
 """
 
 import logging
+import os
 import shutil
 from pathlib import Path
 from typing import Optional, Union
@@ -36,14 +37,20 @@ class FileHandler:
         """
         Safely write content to file with backup.
 
+        Overwrites ('w'/'wb') go to a sibling temporary file that is moved into
+        place with os.replace, so an interrupted write never leaves a truncated
+        file; the original file's permission bits are kept. Other modes, such as
+        appends, write to the file directly.
+
         Args:
             filepath: Path to file
             content: Content to write
-            mode: Write mode ('w' for text, 'wb' for binary)
+            mode: Write mode ('w' for text, 'wb' for binary, 'a'/'ab' to append)
 
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = None
         try:
             filepath = Path(filepath)
             FileHandler.ensure_dir(filepath.parent)
@@ -54,13 +61,28 @@ class FileHandler:
                 shutil.copy2(filepath, backup_path)
                 logger.debug(f"Created backup: {backup_path}")
 
-            with open(filepath, mode) as f:
+            if mode not in ("w", "wb"):
+                # Appends must extend the existing content, so no temp file
+                with open(filepath, mode) as f:
+                    f.write(content)
+                logger.info(f"Successfully wrote to {filepath}")
+                return True
+
+            tmp_path = filepath.with_name(filepath.name + ".tmp")
+            with open(tmp_path, mode) as f:
                 f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+            if filepath.exists():
+                shutil.copymode(filepath, tmp_path)
+            os.replace(tmp_path, filepath)
 
             logger.info(f"Successfully wrote to {filepath}")
             return True
         except Exception as e:
             logger.error(f"Error writing to {filepath}: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
             return False
 
     @staticmethod
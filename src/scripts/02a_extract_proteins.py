@@ -9,10 +9,12 @@ Snakemake Context Injection:
 - Input:  genomes_dir, targets_file
 - Output: proteins_dir, refs_dir
 - Params: uniprot_taxid (optional)
+- Threads: genomes searched concurrently
 """
 
 import logging
 import os
+import re
 import sys
 from pathlib import Path
 
@@ -23,6 +25,8 @@ from mutation_scan.core.tblastn_extractor import TblastnSequenceExtractor
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+GENE_SYMBOL_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9_.\-]*$')
+
 # ---------------------------------------------------------
 # SNAKEMAKE CONTEXT INJECTION
 # ---------------------------------------------------------
@@ -57,6 +61,7 @@ logger.info(f"  Proteins Output: {proteins_dir}")
 logger.info(f"  References Dir: {refs_dir}")
 logger.info(f"  UniProt TaxID: {uniprot_taxid if uniprot_taxid else 'None (local refs only)'}")
 logger.info(f"  Skip Extraction: {skip_extraction}")
+logger.info(f"  Threads: {snakemake.threads}")
 
 # ---------------------------------------------------------
 # EARLY EXIT: If skip_extraction is True and proteins already exist
@@ -77,12 +82,17 @@ if skip_extraction:
 # STEP 1.4: LOAD TARGET GENES
 # ---------------------------------------------------------
 with open(targets_file, 'r') as f:
-    target_genes = [line.strip() for line in f if line.strip()]
+    target_genes = [gene for gene in map(str.strip, f) if gene]
 
 if not target_genes:
     logger.error(f"CRITICAL: No target genes loaded from {targets_file}")
     sys.exit(1)
 
+# Gene names become reference/output filenames, so flag anything that is not a plain symbol
+malformed_genes = [gene for gene in target_genes if not GENE_SYMBOL_RE.match(gene)]
+if malformed_genes:
+    logger.warning(f"Target genes with unexpected characters in {targets_file}: {malformed_genes}")
+
 logger.info(f"Target genes loaded: {target_genes}")
 
 # ---------------------------------------------------------
@@ -95,22 +105,21 @@ extractor = TblastnSequenceExtractor(
     refs_dir=refs_dir,
     output_dir=proteins_dir,
     tblastn_binary="tblastn",
-    uniprot_taxid=uniprot_taxid if uniprot_taxid else None
+    uniprot_taxid=uniprot_taxid if uniprot_taxid else None,
+    max_workers=snakemake.threads
 )
 
 # ---------------------------------------------------------
 # THE BLAST SHIELD: Pre-flight Reference Validation
 # ---------------------------------------------------------
+# One directory scan: names of non-empty reference files
+with os.scandir(refs_dir) as entries:
+    nonempty_refs = {entry.name for entry in entries if entry.is_file() and entry.stat().st_size > 0}
+
 missing_refs = []
 for gene in target_genes:
-    ref_fasta = refs_dir / f"{gene}.fasta"
-    ref_faa = refs_dir / f"{gene}_WT.faa"
-
-    # Check if either valid file exists and has content
-    fasta_valid = ref_fasta.exists() and ref_fasta.stat().st_size > 0
-    faa_valid = ref_faa.exists() and ref_faa.stat().st_size > 0
-
-    if not (fasta_valid or faa_valid):
+    # Either {gene}.fasta or {gene}_WT.faa must exist and have content
+    if f"{gene}.fasta" not in nonempty_refs and f"{gene}_WT.faa" not in nonempty_refs:
         missing_refs.append(gene)
 
 if missing_refs:
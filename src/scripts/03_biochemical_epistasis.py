@@ -69,7 +69,9 @@ def apply_controlscan(mutation_str):
         return 1.0  # Baseline fallback if parsing fails
 
 
-df['ControlScan_Score'] = df['Mutation'].apply(apply_controlscan)
+# The same mutation recurs across many genomes: score each distinct one once
+unique_scores = {mutation: apply_controlscan(mutation) for mutation in df['Mutation'].unique()}
+df['ControlScan_Score'] = df['Mutation'].map(unique_scores)
 
 # ---------------------------------------------------------
 # PHASE 3: Epistasis Networks & Composite Scoring
@@ -1,11 +1,14 @@
+import importlib.util
 import logging
 import os
 import re
+import shlex
 import shutil
 import stat
 import subprocess
 import sys
 import urllib.request
+from functools import lru_cache
 from urllib.error import ContentTooShortError
 from pathlib import Path
 
@@ -47,6 +50,8 @@ DOCKING_SEED_DEFAULT = 42
 QC_CLASH_DISTANCE_ANGSTROM = 2.0
 QC_MAX_CLASH_PAIRS = 20
 
+MUTATION_TOKEN_RE = re.compile(r"^([A-Za-z])(\d+)([A-Za-z])$")
+
 # Default active-site centers for target proteins (x, y, z)
 TARGET_POCKET_CENTERS = {
     "acrb": (18.0, -24.0, 5.0),
@@ -78,7 +83,7 @@ def parse_mutation_token(token, chain_map, default_chain="A"):
         gene, mutation = raw.split(":", 1)
         gene = gene.strip().lower()
 
-    match = re.match(r"^([A-Za-z])(\d+)([A-Za-z])$", mutation.strip())
+    match = MUTATION_TOKEN_RE.match(mutation.strip())
     if not match:
         return None
 
@@ -101,48 +106,52 @@ def parse_mutation_token(token, chain_map, default_chain="A"):
     }
 
 
-def find_ca_coord(pdb_path, chain_id, residue_num):
-    try:
-        with open(pdb_path, "r", encoding="utf-8", errors="ignore") as handle:
-            for line in handle:
-                if not line.startswith("ATOM"):
-                    continue
-                if line[12:16].strip() != "CA":
-                    continue
-                if line[21].strip() != str(chain_id).strip():
-                    continue
+@lru_cache(maxsize=8)
+def _pdb_residue_index(pdb_path, mtime_ns):
+    # (chain, residue) -> first ATOM residue name and first CA coordinate, from one read of the PDB.
+    # mtime_ns is part of the cache key so an edited structure is re-read.
+    names = {}
+    ca_coords = {}
+    with open(pdb_path, "r", encoding="utf-8", errors="ignore") as handle:
+        for line in handle:
+            if not line.startswith("ATOM") or len(line) < 27:
+                continue
+            try:
+                key = (line[21].strip(), int(line[22:26].strip()))
+            except ValueError:
+                continue
+            names.setdefault(key, line[17:20].strip().upper())
+            if key not in ca_coords and line[12:16].strip() == "CA":
                 try:
-                    seq_num = int(line[22:26].strip())
-                except ValueError:
-                    continue
-                if seq_num == int(residue_num):
-                    return (
+                    ca_coords[key] = (
                         float(line[30:38]),
                         float(line[38:46]),
                         float(line[46:54]),
                     )
+                except ValueError:
+                    continue
+    return names, ca_coords
+
+
+def load_pdb_residue_index(pdb_path):
+    try:
+        return _pdb_residue_index(str(pdb_path), os.stat(pdb_path).st_mtime_ns)
     except OSError:
         return None
-    return None
+
+
+def find_ca_coord(pdb_path, chain_id, residue_num):
+    index = load_pdb_residue_index(pdb_path)
+    if index is None:
+        return None
+    return index[1].get((str(chain_id).strip(), int(residue_num)))
 
 
 def find_residue_name(pdb_path, chain_id, residue_num):
-    try:
-        with open(pdb_path, "r", encoding="utf-8", errors="ignore") as handle:
-            for line in handle:
-                if not line.startswith("ATOM"):
-                    continue
-                if line[21].strip() != str(chain_id).strip():
-                    continue
-                try:
-                    seq_num = int(line[22:26].strip())
-                except ValueError:
-                    continue
-                if seq_num == int(residue_num):
-                    return line[17:20].strip().upper()
-    except OSError:
+    index = load_pdb_residue_index(pdb_path)
+    if index is None:
         return None
-    return None
+    return index[0].get((str(chain_id).strip(), int(residue_num)))
 
 
 def pocket_center_from_mutations(pdb_path, parsed_mutations):
@@ -193,10 +202,17 @@ def resolve_docking_center(config, docking_target):
     return center
 
 
+def render_command(cmd, max_len=200):
+    rendered = shlex.join(str(arg) for arg in cmd)
+    if len(rendered) <= max_len:
+        return rendered
+    return f"{rendered[:max_len]}... (+{len(rendered) - max_len} chars)"
+
+
 def run_cmd(cmd, label, allow_failure=False):
     result = subprocess.run(cmd, capture_output=True, text=True)
     if result.returncode != 0 and not allow_failure:
-        logger.error("Command failed during %s", label)
+        logger.error("Command failed during %s: %s", label, render_command(cmd))
         if result.stdout:
             logger.error(result.stdout)
         if result.stderr:
@@ -204,6 +220,14 @@ def run_cmd(cmd, label, allow_failure=False):
     return result
 
 
+def is_nonempty_file(path):
+    # Single stat call rather than exists() followed by stat()
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+
 def as_bool(value):
     return str(value).strip().lower() in {"1", "true", "yes", "y", "on"}
 
@@ -234,7 +258,7 @@ def ensure_smina_binary(work_dir):
         for attempt in range(1, max_attempts + 1):
             try:
                 urllib.request.urlretrieve(SMINA_URL, smina_path)
-                if smina_path.exists() and smina_path.stat().st_size > 0:
+                if is_nonempty_file(smina_path):
                     last_error = None
                     break
             except ContentTooShortError as exc:
@@ -268,7 +292,7 @@ def ensure_smina_binary(work_dir):
 
 def ensure_ligand_file(ligand_path):
     ligand_path.parent.mkdir(parents=True, exist_ok=True)
-    if ligand_path.exists() and ligand_path.stat().st_size > 0:
+    if is_nonempty_file(ligand_path):
         return
     logger.info("Ligand file missing, downloading %s", ligand_path)
     urllib.request.urlretrieve(CIPRO_URL, ligand_path)
@@ -276,7 +300,7 @@ def ensure_ligand_file(ligand_path):
 
 def prepare_ligand_pdbqt(ligand_path, out_dir):
     ligand_pdbqt = out_dir / f"{ligand_path.stem}.pdbqt"
-    if ligand_pdbqt.exists() and ligand_pdbqt.stat().st_size > 0:
+    if is_nonempty_file(ligand_pdbqt):
         return ligand_pdbqt
 
     candidate_cmds = [
@@ -300,13 +324,29 @@ def prepare_ligand_pdbqt(ligand_path, out_dir):
 
     failures = []
     for cmd in candidate_cmds:
+        # Probe availability in-process rather than paying an interpreter start-up per missing candidate
+        if cmd[0] == sys.executable:
+            available = importlib.util.find_spec("meeko") is not None
+        else:
+            available = shutil.which(cmd[0]) is not None
+        if not available:
+            failures.append(
+                {
+                    "cmd": render_command(cmd),
+                    "returncode": None,
+                    "stdout": "",
+                    "stderr": "not installed",
+                }
+            )
+            continue
+
         result = run_cmd(cmd, "ligand preparation", allow_failure=True)
-        if result.returncode == 0 and ligand_pdbqt.exists() and ligand_pdbqt.stat().st_size > 0:
+        if result.returncode == 0 and is_nonempty_file(ligand_pdbqt):
             return ligand_pdbqt
 
         failures.append(
             {
-                "cmd": " ".join(cmd),
+                "cmd": render_command(cmd),
                 "returncode": result.returncode,
                 "stdout": (result.stdout or "").strip(),
                 "stderr": (result.stderr or "").strip(),
@@ -328,7 +368,7 @@ def prepare_ligand_pdbqt(ligand_path, out_dir):
 
 def prepare_receptor_pdbqt(receptor_pdb, center, out_prefix):
     receptor_pdbqt = Path(f"{out_prefix}.pdbqt")
-    if receptor_pdbqt.exists() and receptor_pdbqt.stat().st_size > 0:
+    if is_nonempty_file(receptor_pdbqt):
         return receptor_pdbqt
 
     base_cmd = [
@@ -593,7 +633,7 @@ def select_mutations_for_docking(parsed_mutations, target_protein):
     return [m for m in parsed_mutations if m.get("gene") == target]
 
 
-def append_disclaimer(readme_path, protein_name, ligand_name, mutation_network, wt_affinity, mut_affinity, ddg_score):
+def format_disclaimer(protein_name, ligand_name, mutation_network, wt_affinity, mut_affinity, ddg_score):
     block = f"""=====================================================================
 MUTATIONSCAN: BEST-EFFORT PARTIAL DOCKING SIMULATION REPORT
 =====================================================================
@@ -612,8 +652,7 @@ What we have conducted is a targeted, high-throughput partial docking simulation
 While this rapid geometric search is highly effective for estimating relative thermodynamic shifts (ΔΔG) and localized steric clashes, it is a "best-effort" partial docking. It does not account for large-scale backbone conformational flexibility, explicit solvent dynamics, or microsecond-scale entropic effects. For absolute free-energy perturbation (FEP) calculations or fully accurate binding affinities, please conduct a full-scale Molecular Dynamics (MD) simulation using a suite such as Gromacs or AMBER coupled with thermodynamic integration.
 =====================================================================
 """
-    with open(readme_path, "a", encoding="utf-8") as handle:
-        handle.write(block)
+    return block
 
 
 def fmt_number(value):
@@ -686,6 +725,7 @@ def main():
     mutated_pdbs_dir.mkdir(parents=True, exist_ok=True)
     docking_report.parent.mkdir(parents=True, exist_ok=True)
     readme_path.parent.mkdir(parents=True, exist_ok=True)
+    # Truncate up front so a failed run never leaves a previous README beside partial outputs
     readme_path.write_text("", encoding="utf-8")
 
     if not networks_csv.exists():
@@ -736,7 +776,24 @@ def main():
             "biophysics_deep_relaxed_md is enabled but OpenMM relaxation is disabled in MVBM mode; continuing without minimization."
         )
 
+    # The wild-type receptor, ligand, box and seed are the same for every
+    # network (the box is always fixed_center), so dock WT once up front
+    wt_receptor_prefix = mutated_pdbs_dir / "WT_receptor"
+    wt_receptor_pdbqt = prepare_receptor_pdbqt(wt_structure_for_docking, fixed_center, wt_receptor_prefix)
+    wt_pose = mutated_pdbs_dir / "WT_docked.pdbqt"
+    wt_affinity = run_docking(
+        docking_binary,
+        wt_receptor_pdbqt,
+        ligand_pdbqt,
+        fixed_center,
+        wt_pose,
+        exhaustiveness=docking_exhaustiveness,
+        seed=docking_seed,
+    )
+
     results = []
+    # Disclaimer blocks are collected and written once after the loop
+    readme_blocks = []
     for idx, row in df.iterrows():
         node_1 = str(row["Node_1"]).strip()
         node_2 = str(row["Node_2"]).strip()
@@ -768,15 +825,14 @@ def main():
                     "center_z": None,
                 }
             )
-            append_disclaimer(
-                readme_path,
+            readme_blocks.append(format_disclaimer(
                 reference_pdb.stem,
                 ligand_path.name,
                 mutation_network,
                 "N/A",
                 "N/A",
                 "N/A",
-            )
+            ))
             continue
 
         if not docking_mutations:
@@ -797,32 +853,18 @@ def main():
                     "center_z": None,
                 }
             )
-            append_disclaimer(
-                readme_path,
+            readme_blocks.append(format_disclaimer(
                 reference_pdb.stem,
                 ligand_path.name,
                 mutation_network,
                 "N/A",
                 "N/A",
                 "N/A",
-            )
+            ))
             continue
 
         center = fixed_center
 
-        wt_receptor_prefix = mutated_pdbs_dir / f"network_{idx + 1}_WT_receptor"
-        wt_receptor_pdbqt = prepare_receptor_pdbqt(wt_structure_for_docking, center, wt_receptor_prefix)
-        wt_pose = mutated_pdbs_dir / f"network_{idx + 1}_WT_docked.pdbqt"
-        wt_affinity = run_docking(
-            docking_binary,
-            wt_receptor_pdbqt,
-            ligand_pdbqt,
-            center,
-            wt_pose,
-            exhaustiveness=docking_exhaustiveness,
-            seed=docking_seed,
-        )
-
         mutated_pdb = mutated_pdbs_dir / f"network_{idx + 1}_mutated.pdb"
         mut_affinity = None
         status = "ok"
@@ -896,17 +938,17 @@ def main():
             }
         )
 
-        append_disclaimer(
-            readme_path,
+        readme_blocks.append(format_disclaimer(
             reference_pdb.stem,
             ligand_path.name,
             mutation_network,
             fmt_number(wt_affinity),
             fmt_number(mut_affinity),
             fmt_number(ddg),
-        )
+        ))
 
     pd.DataFrame(results).to_csv(docking_report, index=False)
+    readme_path.write_text("".join(readme_blocks), encoding="utf-8")
 
 
 if __name__ == "__main__":
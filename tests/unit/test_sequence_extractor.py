@@ -1,7 +1,8 @@
 """Unit tests for sequence extractor module."""
 
+import pandas as pd
 import pytest
-from mutation_scan.core import SequenceTranslator
+from mutation_scan.core import SequenceExtractor, SequenceTranslator
 
 class TestSequenceTranslator:
     """Test suite for SequenceTranslator class."""
@@ -47,3 +48,36 @@ class TestSequenceTranslator:
     def test_genetic_code_completeness(self):
         """Test that genetic code is complete."""
         assert len(self.translator.STANDARD_GENETIC_CODE) == 64
+
+
+class TestSequenceExtractor:
+    """Test suite for SequenceExtractor genome discovery."""
+
+    def test_get_available_genomes_all_suffixes(self, tmp_path):
+        """Test that .fasta, .fna and .fa genomes are discovered in one pass."""
+        for name in ["GCF_1.fasta", "GCF_2.fna", "GCF_3.fa", "notes.txt"]:
+            (tmp_path / name).write_text(">contig1\nATG\n")
+        (tmp_path / "subdir.fna").mkdir()
+
+        extractor = SequenceExtractor(tmp_path)
+        assert extractor.get_available_genomes() == ["GCF_1", "GCF_2", "GCF_3"]
+
+    def test_extract_sequences_from_fna_genome(self, tmp_path):
+        """Test that genomes saved as .fna are found by extract_sequences."""
+        genomes_dir = tmp_path / "genomes"
+        genomes_dir.mkdir()
+        (genomes_dir / "GCF_1.fna").write_text(">contig1\nATGAAAGCGTAA\n")
+        genes_df = pd.DataFrame([
+            {"Gene": "geneX", "Contig": "contig1", "Start": 1, "End": 12, "Strand": "+"}
+        ])
+
+        extractor = SequenceExtractor(genomes_dir)
+        successful, failed = extractor.extract_sequences(genes_df, "GCF_1", tmp_path / "out")
+        assert (successful, failed) == (1, 0)
+        assert (tmp_path / "out" / "GCF_1_geneX.faa").exists()
+
+    def test_extract_sequences_missing_genome(self, tmp_path):
+        """Test that a missing genome still raises FileNotFoundError."""
+        extractor = SequenceExtractor(tmp_path)
+        with pytest.raises(FileNotFoundError):
+            extractor.extract_sequences(pd.DataFrame(), "GCF_missing", tmp_path / "out")
@@ -0,0 +1,80 @@
+"""Unit tests for the support toolkit helpers."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+TOOLKIT_PATH = Path(__file__).resolve().parents[2] / "utility scripts" / "mutationscan_support_toolkit.py"
+
+
+@pytest.fixture(scope="module")
+def toolkit():
+    """Load the toolkit script as a module."""
+    spec = importlib.util.spec_from_file_location("mutationscan_support_toolkit", TOOLKIT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestJsonCell:
+    """Test suite for nested metadata cell serialization."""
+
+    def test_matches_stdlib_ascii_format(self, toolkit):
+        """Test that cells keep the json.dumps(ensure_ascii=True) layout."""
+        value = {"host": "Homo sapiens", "site": "São Paulo", "mic": [0.5, 1.0]}
+        assert toolkit._json_cell(value) == '{"host": "Homo sapiens", "site": "S\\u00e3o Paulo", "mic": [0.5, 1.0]}'
+
+
+class TestReadStrCsv:
+    """Test suite for string-typed CSV reads."""
+
+    def test_genome_ids_round_trip_unchanged(self, toolkit, tmp_path):
+        """Test that IDs with trailing or leading zeros are not reparsed as numbers."""
+        csv_path = tmp_path / "genomes.csv"
+        csv_path.write_text("Genome ID,Accession,Notes\n573.12340,0123,\n1280.10,0456,\n")
+
+        df = toolkit._read_str_csv(csv_path)
+
+        assert df["Genome ID"].tolist() == ["573.12340", "1280.10"]
+        assert df["Accession"].tolist() == ["0123", "0456"]
+        assert df["Notes"].tolist() == ["", ""]
+
+
+class TestCleanLocation:
+    """Test suite for geographic location cleaning."""
+
+    @pytest.mark.parametrize("value", [None, float("nan"), "", "   "])
+    def test_missing_values_are_unknown(self, toolkit, value):
+        """Test that missing or blank locations map to Unknown."""
+        assert toolkit._clean_location(value) == "Unknown"
+
+    def test_strips_country_prefix_and_parentheticals(self, toolkit):
+        """Test that country prefixes and parenthetical notes are removed."""
+        assert toolkit._clean_location("USA: Boston (MGH),") == "Boston"
+
+
+class TestFetchMetadataCache:
+    """Test suite for the fetch-metadata record cache."""
+
+    def test_cache_entries_are_compact_json(self, toolkit, tmp_path, monkeypatch):
+        """Test that cached records are written without separator whitespace."""
+        record = {"genome_id": "573.12340", "genome_name": "Klebsiella pneumoniae", "mlst": ["ST258", "ST11"]}
+        monkeypatch.setattr(toolkit, "_request_json", lambda *args, **kwargs: ([record], None))
+        input_csv = tmp_path / "genomes.csv"
+        input_csv.write_text("Genome ID\n573.12340\n")
+        cache_dir = tmp_path / "cache"
+
+        args = toolkit.build_parser().parse_args([
+            "fetch-metadata",
+            "--input-csv", str(input_csv),
+            "--output-metadata-csv", str(tmp_path / "metadata.csv"),
+            "--output-enriched-csv", str(tmp_path / "enriched.csv"),
+            "--failed-log", str(tmp_path / "failed.txt"),
+            "--cache-dir", str(cache_dir),
+            "--sleep-seconds", "0",
+        ])
+        args.func(args)
+
+        cached = (cache_dir / "573.12340.json").read_text(encoding="utf-8")
+        assert cached == '{"genome_id":"573.12340","genome_name":"Klebsiella pneumoniae","mlst":["ST258","ST11"]}'
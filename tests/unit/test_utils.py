@@ -71,6 +71,37 @@ class TestFileHandler:
         assert backup_path.exists()
         assert backup_path.read_text() == "original content"
 
+    def test_safe_write_failure_keeps_original(self, tmp_path):
+        """Test that a failed write leaves the original file and no temp file."""
+        file_path = tmp_path / "test.txt"
+        FileHandler.safe_write(file_path, "original content")
+
+        # Writing str in binary mode fails mid-write
+        assert not FileHandler.safe_write(file_path, "new content", mode="wb")
+
+        assert file_path.read_text() == "original content"
+        assert not (tmp_path / "test.txt.tmp").exists()
+
+    def test_safe_write_append_keeps_existing_content(self, tmp_path):
+        """Test that append mode extends the file instead of replacing it."""
+        file_path = tmp_path / "test.txt"
+        FileHandler.safe_write(file_path, "first\n")
+
+        assert FileHandler.safe_write(file_path, "second\n", mode="a")
+
+        assert file_path.read_text() == "first\nsecond\n"
+
+    def test_safe_write_preserves_permissions(self, tmp_path):
+        """Test that overwriting keeps the original file mode."""
+        file_path = tmp_path / "run.sh"
+        file_path.write_text("echo old\n")
+        file_path.chmod(0o750)
+
+        assert FileHandler.safe_write(file_path, "echo new\n")
+
+        assert file_path.stat().st_mode & 0o777 == 0o750
+        assert file_path.read_text() == "echo new\n"
+
     def test_safe_read_reads_file(self, tmp_path):
         """Test that safe_read reads file content."""
         file_path = tmp_path / "test.txt"
@@ -1,17 +1,26 @@
 import argparse
 import csv
 import json
+import os
 import re
 import shutil
+import sys
+import threading
 import time
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-import pandas as pd
-import requests
+# pandas and requests are imported inside the commands that use them, so qc-genomes
+# and --help start without loading either
+try:
+    import orjson
+except ImportError:  # optional parse speed-up; json below accepts the same input
+    orjson = None
 
 API_GENOME = "https://www.bv-brc.org/api/genome/"
 API_GENOME_SEQ = "https://www.bv-brc.org/api/genome_sequence/"
+_RULE = "=" * 60
 
 
 def _normalize_ids(series):
@@ -28,38 +37,123 @@ def _normalize_ids(series):
     return ordered
 
 
-def _request_json(url, timeout, retries):
+def _print_summary(*lines):
+    # Build the whole banner first so it reaches stdout as one write, not one per line
+    sys.stdout.write("\n".join([_RULE, *map(str, lines), _RULE]) + "\n")
+    sys.stdout.flush()
+
+
+def _read_str_csv(path):
+    # C engine on purpose: pyarrow infers types before casting to str, so "573.12340" became "573.1234"
+    import pandas as pd
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+def _json_cell(value):
+    # Always the stdlib encoder: orjson's compact, non-ASCII output would change the CSV bytes
+    return json.dumps(value, ensure_ascii=True)
+
+
+def _json_record(value):
+    # Cache files are only read back by _json_parse, so they can be compact (orjson when available)
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+def _json_parse(data):
+    # Parses raw response/cache bytes directly; both parsers raise ValueError subclasses
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _new_session():
+    # One keep-alive session per command: TCP/TLS setup is paid once, not per genome
+    import requests
+    session = requests.Session()
+    session.headers["User-Agent"] = "MutationScan-Toolkit/1.0"
+    return session
+
+
+class _RateLimiter:
+    # Spaces requests across all threads to at most `rate` per second (0 = unlimited)
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def _backoff_seconds(response, attempt, base):
+    # Throttled responses honour Retry-After, else back off exponentially (1, 2, 4 ... 10s)
+    if response is not None and response.status_code in (429, 503):
+        retry_after = response.headers.get("Retry-After", "").strip()
+        if retry_after.isdigit():
+            return float(retry_after)
+        return min(10.0, 2.0 ** (attempt - 1))
+    return base * attempt
+
+
+def _request_json(session, url, timeout, retries, query=None, limiter=None):
+    # RQL queries passed as `query` go in a POST body, which avoids URL length limits
+    import requests
     last_err = "unknown"
     for attempt in range(1, retries + 1):
+        r = None
         try:
-            r = requests.get(url, timeout=timeout)
+            if limiter is not None:
+                limiter.wait()
+            if query is None:
+                r = session.get(url, timeout=timeout)
+            else:
+                r = session.post(
+                    url,
+                    data=query,
+                    headers={"Content-Type": "application/rqlquery+x-www-form-urlencoded", "Accept": "application/json"},
+                    timeout=timeout,
+                )
             if r.status_code == 200:
-                return r.json(), None
+                return _json_parse(r.content), None
             last_err = f"HTTP {r.status_code}"
-        except requests.RequestException as exc:
+        except (requests.RequestException, ValueError) as exc:
             last_err = f"{type(exc).__name__}: {exc}"
-        time.sleep(0.25 * attempt)
+        time.sleep(_backoff_seconds(r, attempt, 0.25))
     return None, last_err
 
 
 def cmd_download_rest(args):
+    import requests
+
     output_dir = Path(args.output_dir)
     csv_file = Path(args.csv_file)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_csv(csv_file, dtype=str, keep_default_na=False)
+    df = _read_str_csv(csv_file)
     if args.genome_id_column not in df.columns:
         raise KeyError(f"Column '{args.genome_id_column}' missing in {csv_file}")
 
     all_ids = _normalize_ids(df[args.genome_id_column])
 
     downloaded_ids = set()
-    for f in output_dir.glob("*.fna"):
-        try:
-            if f.stat().st_size > args.min_bytes:
-                downloaded_ids.add(f.stem)
-        except OSError:
-            continue
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".fna"):
+                continue
+            try:
+                if entry.is_file() and entry.stat().st_size > args.min_bytes:
+                    downloaded_ids.add(entry.name[: -len(".fna")])
+            except OSError:
+                continue
 
     missing = [gid for gid in all_ids if gid not in downloaded_ids]
     print(f"Total IDs in CSV: {len(all_ids)}")
@@ -69,68 +163,94 @@ def cmd_download_rest(args):
         print("All genomes already present. Nothing to download.")
         return
 
-    headers = {"Accept": "application/dna+fasta", "User-Agent": "MutationScan-Toolkit/1.0"}
+    headers = {"Accept": "application/dna+fasta"}
+    # requests.Session is not guaranteed thread-safe: one keep-alive session per worker
+    local = threading.local()
+
+    def session():
+        if not hasattr(local, "session"):
+            local.session = _new_session()
+        return local.session
 
     def api_url(gid):
         return f"{API_GENOME_SEQ}?eq(genome_id,{gid})&limit({args.api_limit})"
 
-    success = 0
-    failed = []
+    limiter = _RateLimiter(args.max_rps)
 
-    for i, gid in enumerate(missing, start=1):
+    def download_one(gid):
         out_path = output_dir / f"{gid}.fna"
         if out_path.exists() and out_path.stat().st_size > args.min_bytes:
-            continue
+            return "present", None
 
         last_err = "unknown"
-        ok = False
         for attempt in range(1, args.retries + 1):
             try:
-                r = requests.get(api_url(gid), headers=headers, timeout=args.timeout)
+                limiter.wait()
+                r = session().get(api_url(gid), headers=headers, timeout=args.timeout)
                 if r.status_code != 200:
                     last_err = f"HTTP {r.status_code}"
-                    time.sleep(0.2 * attempt)
+                    time.sleep(_backoff_seconds(r, attempt, 0.2))
                     continue
-                payload = r.text or ""
-                if len(payload.encode("utf-8", errors="ignore")) <= args.min_bytes:
+                # Keep the body as raw bytes: FASTA is ASCII, so decoding and re-encoding buys nothing
+                payload = r.content or b""
+                if len(payload) <= args.min_bytes:
                     last_err = "payload_too_small"
                     time.sleep(0.2 * attempt)
                     continue
                 tmp = output_dir / f"{gid}.fna.part"
-                tmp.write_text(payload, encoding="utf-8")
+                tmp.write_bytes(payload)
                 tmp.replace(out_path)
-                success += 1
-                ok = True
-                break
+                return "downloaded", None
             except requests.RequestException as exc:
                 last_err = f"{type(exc).__name__}: {exc}"
                 time.sleep(0.2 * attempt)
-        if not ok:
-            failed.append((gid, last_err))
+        return "failed", last_err
 
-        if i % 25 == 0 or i == len(missing):
-            print(f"Progress {i}/{len(missing)} | success={success} failed={len(failed)}")
+    success = 0
+    errors = {}
+    # Track presence in memory so the summary doesn't need a second directory scan
+    present = set(downloaded_ids)
+
+    # Downloads are network-bound, so --threads workers overlap request latency
+    with ThreadPoolExecutor(max_workers=max(1, args.threads)) as pool:
+        futures = {pool.submit(download_one, gid): gid for gid in missing}
+        total = len(missing)
+        for i, future in enumerate(as_completed(futures), start=1):
+            gid = futures[future]
+            status, err = future.result()
+            if status == "failed":
+                errors[gid] = err
+            else:
+                present.add(gid)
+                if status == "downloaded":
+                    success += 1
+
+            if i % 25 == 0 or i == total:
+                print(f"Progress {i}/{total} | success={success} failed={len(errors)}")
+
+    failed = [(gid, errors[gid]) for gid in missing if gid in errors]
 
     failed_log = output_dir / args.failed_log
     missing_log = output_dir / args.missing_log
     failed_log.write_text("\n".join(g for g, _ in failed) + ("\n" if failed else ""), encoding="utf-8")
 
-    present = {f.stem for f in output_dir.glob("*.fna") if f.stat().st_size > args.min_bytes}
     remaining = [gid for gid in all_ids if gid not in present]
     missing_log.write_text("\n".join(remaining) + ("\n" if remaining else ""), encoding="utf-8")
 
-    print("=" * 60)
-    print(f"Newly downloaded: {success}")
-    print(f"Failed this run: {len(failed)}")
-    print(f"Remaining missing after run: {len(remaining)}")
-    print(f"Failed IDs log: {failed_log}")
-    print(f"Remaining missing log: {missing_log}")
-    print("=" * 60)
+    _print_summary(
+        f"Newly downloaded: {success}",
+        f"Failed this run: {len(failed)}",
+        f"Remaining missing after run: {len(remaining)}",
+        f"Failed IDs log: {failed_log}",
+        f"Remaining missing log: {missing_log}",
+    )
 
 
 def cmd_fetch_metadata(args):
+    import pandas as pd
+
     input_csv = Path(args.input_csv)
-    df = pd.read_csv(input_csv, dtype=str, keep_default_na=False)
+    df = _read_str_csv(input_csv)
     if args.genome_id_column not in df.columns:
         raise KeyError(f"Column '{args.genome_id_column}' missing in {input_csv}")
 
@@ -142,12 +262,14 @@ def cmd_fetch_metadata(args):
     failed_log.parent.mkdir(parents=True, exist_ok=True)
 
     ids = _normalize_ids(df[args.genome_id_column])
+    session = _new_session()
+    limiter = _RateLimiter(args.max_rps)
 
     def batch_query(batch):
-        quoted = ",".join([f'"{gid}"' for gid in batch])
+        quoted = ",".join(f'"{gid}"' for gid in batch)
         limit = max(200, len(batch) * 3)
-        url = f"{API_GENOME}?in(genome_id,({quoted}))&limit({limit})"
-        payload, err = _request_json(url, timeout=args.timeout, retries=args.retries)
+        query = f"in(genome_id,({quoted}))&limit({limit})"
+        payload, err = _request_json(session, API_GENOME, timeout=args.timeout, retries=args.retries, query=query, limiter=limiter)
         if payload is None:
             return {}, err
         out = {}
@@ -159,7 +281,7 @@ def cmd_fetch_metadata(args):
 
     def single_query(gid):
         url = f"{API_GENOME}?eq(genome_id,{gid})&limit(1)"
-        payload, err = _request_json(url, timeout=args.timeout, retries=args.retries)
+        payload, err = _request_json(session, url, timeout=args.timeout, retries=args.retries, limiter=limiter)
         if payload is None:
             return None, err
         if not payload:
@@ -168,19 +290,45 @@ def cmd_fetch_metadata(args):
 
     meta = {}
     failures = []
-    batches = [ids[i : i + args.batch_size] for i in range(0, len(ids), args.batch_size)]
+
+    # Records fetched by earlier runs are reused from --cache-dir ({genome_id}.json)
+    cache_dir = Path(args.cache_dir) if args.cache_dir else None
+    if cache_dir is not None:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        wanted = set(ids)
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                gid = entry.name[: -len(".json")]
+                if entry.name.endswith(".json") and gid in wanted:
+                    try:
+                        meta[gid] = _json_parse(Path(entry.path).read_bytes())
+                    except (OSError, ValueError):
+                        continue
+        print(f"Metadata cache hits: {len(meta)} / {len(ids)}")
+
+    def remember(gid, item):
+        meta[gid] = item
+        if cache_dir is not None:
+            tmp = cache_dir / f"{gid}.json.part"
+            tmp.write_bytes(_json_record(item))
+            tmp.replace(cache_dir / f"{gid}.json")
+
+    to_fetch = [gid for gid in ids if gid not in meta]
+    batches = [to_fetch[i : i + args.batch_size] for i in range(0, len(to_fetch), args.batch_size)]
 
     for i, batch in enumerate(batches, start=1):
         result, err = batch_query(batch)
-        if err is not None:
-            result = {}
         for gid in batch:
             if gid in result:
-                meta[gid] = result[gid]
+                remember(gid, result[gid])
+            elif err is None:
+                # The batch answered for every ID, so an absent ID is genuinely not found
+                failures.append((gid, "not_found"))
             else:
+                # Per-ID requests only when the whole batch request failed
                 item, e = single_query(gid)
                 if item is not None:
-                    meta[gid] = item
+                    remember(gid, item)
                 else:
                     failures.append((gid, e or "unknown"))
         if i % 10 == 0 or i == len(batches):
@@ -198,7 +346,7 @@ def cmd_fetch_metadata(args):
             row = {"genome_id": gid, "metadata_found": 1}
             for k, v in meta[gid].items():
                 if isinstance(v, (dict, list)):
-                    row[k] = json.dumps(v, ensure_ascii=True)
+                    row[k] = _json_cell(v)
                 else:
                     row[k] = v
         else:
@@ -216,29 +364,36 @@ def cmd_fetch_metadata(args):
 
     failed_log.write_text("\n".join(f"{gid}\t{err}" for gid, err in failures) + ("\n" if failures else ""), encoding="utf-8")
 
-    print("=" * 60)
-    print(f"Metadata found: {len(meta)} / {len(ids)}")
-    print(f"Failures: {len(failures)}")
-    print(f"Metadata CSV: {out_meta}")
-    print(f"Enriched CSV: {out_enriched}")
-    print(f"Failed IDs log: {failed_log}")
-    print("=" * 60)
+    _print_summary(
+        f"Metadata found: {len(meta)} / {len(ids)}",
+        f"Failures: {len(failures)}",
+        f"Metadata CSV: {out_meta}",
+        f"Enriched CSV: {out_enriched}",
+        f"Failed IDs log: {failed_log}",
+    )
+
+
+_PARENTHETICAL_RE = re.compile(r"\s*\([^)]*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
 
 
 def _clean_location(value):
-    if pd.isna(value):
+    # Runs once per row: check for None/NaN directly rather than through pandas
+    if value is None or (isinstance(value, float) and value != value):
         return "Unknown"
     text = str(value).strip()
     if not text:
         return "Unknown"
     if ":" in text:
         text = text.split(":", 1)[1].strip()
-    text = re.sub(r"\s*\([^)]*\)", "", text)
-    text = re.sub(r"\s+", " ", text).strip(" ,;-")
+    text = _PARENTHETICAL_RE.sub("", text)
+    text = _WHITESPACE_RE.sub(" ", text).strip(" ,;-")
     return text if text else "Unknown"
 
 
 def cmd_geospatial_matrix(args):
+    import pandas as pd
+
     keep_cols = [
         "Genome ID",
         "Antibiotic",
@@ -258,7 +413,7 @@ def cmd_geospatial_matrix(args):
         path = Path(p)
         if not path.exists():
             raise FileNotFoundError(f"Metadata CSV not found: {path}")
-        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        df = _read_str_csv(path)
         for c in keep_cols:
             if c not in df.columns:
                 df[c] = ""
@@ -275,7 +430,7 @@ def cmd_geospatial_matrix(args):
         path = Path(p)
         if not path.exists():
             raise FileNotFoundError(f"Genomics report not found: {path}")
-        gdf = pd.read_csv(path, dtype=str, keep_default_na=False)
+        gdf = _read_str_csv(path)
         for c in ["Accession", "Gene", "Mutation"]:
             if c not in gdf.columns:
                 raise KeyError(f"Missing {c} in {path}")
@@ -304,18 +459,20 @@ def cmd_geospatial_matrix(args):
     freq.to_csv(out_dir / "Geospatial_Mutation_Long.csv", index=False)
     matrix.to_csv(out_dir / "Geospatial_Mutation_Matrix.csv")
 
-    print("=" * 60)
-    print(f"Sanitized metadata genomes: {len(meta)}")
-    print(f"Regulatory mutation rows: {len(genomics)}")
-    print(f"Merged rows: {len(merged)}")
-    print(f"Unique locations: {merged['geographic_location_clean'].nunique()}")
-    print(f"Unique mutations: {merged['Mutation'].nunique()}")
-    print(f"Output dir: {out_dir}")
-    print("=" * 60)
+    _print_summary(
+        f"Sanitized metadata genomes: {len(meta)}",
+        f"Regulatory mutation rows: {len(genomics)}",
+        f"Merged rows: {len(merged)}",
+        f"Unique locations: {merged['geographic_location_clean'].nunique()}",
+        f"Unique mutations: {merged['Mutation'].nunique()}",
+        f"Output dir: {out_dir}",
+    )
 
 
 def cmd_geospatial_heatmap(args):
     import matplotlib.pyplot as plt
+    import numpy as np
+    import pandas as pd
     import seaborn as sns
 
     input_csv = Path(args.input_csv)
@@ -324,7 +481,7 @@ def cmd_geospatial_heatmap(args):
     out_matrix.parent.mkdir(parents=True, exist_ok=True)
     out_plot.parent.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_csv(input_csv, dtype=str, keep_default_na=False)
+    df = _read_str_csv(input_csv)
     for c in ["Gene", "Mutation", "geographic_location_clean"]:
         if c not in df.columns:
             raise KeyError(f"Missing required column: {c}")
@@ -343,8 +500,16 @@ def cmd_geospatial_heatmap(args):
     df = df[~df["geographic_location_clean"].str.lower().isin(exclude)].copy()
     df = df[(df["Gene"] != "") & (df["Mutation"] != "") & (df["Gene_Mutation"] != ":")]
 
-    freq = df.groupby(["geographic_location_clean", "Gene_Mutation"], dropna=False).size().reset_index(name="mutation_frequency")
-    matrix = freq.pivot(index="geographic_location_clean", columns="Gene_Mutation", values="mutation_frequency").fillna(0).astype(int)
+    # scatter-add counts into a dense location x Gene:Mutation matrix
+    loc_codes, locs = pd.factorize(df["geographic_location_clean"], sort=True)
+    mut_codes, muts = pd.factorize(df["Gene_Mutation"], sort=True)
+    counts = np.zeros((len(locs), len(muts)), dtype=np.int64)
+    np.add.at(counts, (loc_codes, mut_codes), 1)
+    matrix = pd.DataFrame(
+        counts,
+        index=pd.Index(locs, name="geographic_location_clean"),
+        columns=pd.Index(muts, name="Gene_Mutation"),
+    )
     matrix.to_csv(out_matrix)
 
     top_n = max(1, args.top_n)
@@ -363,13 +528,13 @@ def cmd_geospatial_heatmap(args):
     plt.savefig(out_plot, dpi=300)
     plt.close()
 
-    print("=" * 60)
-    print(f"Filtered rows: {len(df)}")
-    print(f"Unique locations: {df['geographic_location_clean'].nunique()}")
-    print(f"Unique Gene_Mutation labels: {df['Gene_Mutation'].nunique()}")
-    print(f"Matrix saved: {out_matrix}")
-    print(f"Heatmap saved: {out_plot}")
-    print("=" * 60)
+    _print_summary(
+        f"Filtered rows: {len(df)}",
+        f"Unique locations: {df['geographic_location_clean'].nunique()}",
+        f"Unique Gene_Mutation labels: {df['Gene_Mutation'].nunique()}",
+        f"Matrix saved: {out_matrix}",
+        f"Heatmap saved: {out_plot}",
+    )
 
 
 def _n50(lengths):
@@ -385,6 +550,37 @@ def _n50(lengths):
     return 0
 
 
+def _fasta_stats(fp):
+    # Whole-file bytes pass: records are split on header starts and measured with
+    # C-level bytes ops instead of decoding, stripping and upper-casing every line
+    data = fp.read_bytes()
+    contig_lengths = []
+    n_count = 0
+    chunks = data.split(b"\n>")
+    for i, chunk in enumerate(chunks):
+        if i or chunk.startswith(b">"):
+            seq = chunk.partition(b"\n")[2]
+        else:
+            seq = chunk  # sequence lines before the first header
+        seq = seq.translate(None, b" \t\r\n")
+        if seq:
+            contig_lengths.append(len(seq))
+            n_count += seq.count(b"N") + seq.count(b"n")
+    return contig_lengths, sum(contig_lengths), n_count
+
+
+def _copy_if_changed(src, dst):
+    # copy2 preserves mtime, so a matching size + mtime means a previous run already copied it
+    try:
+        s, d = src.stat(), dst.stat()
+        if s.st_size == d.st_size and int(s.st_mtime) == int(d.st_mtime):
+            return False
+    except FileNotFoundError:
+        pass
+    shutil.copy2(src, dst)
+    return True
+
+
 def cmd_qc_genomes(args):
     input_dir = Path(args.input_dir)
     out_csv = Path(args.output_summary_csv)
@@ -395,27 +591,15 @@ def cmd_qc_genomes(args):
     contig_counter = Counter()
     files = sorted(input_dir.glob("*.fna"))
 
-    for fp in files:
-        contig_lengths = []
-        total_bp = 0
-        n_count = 0
-        cur = 0
-        with fp.open("r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                if line.startswith(">"):
-                    if cur:
-                        contig_lengths.append(cur)
-                        cur = 0
-                    continue
-                seq = line.strip().upper()
-                if not seq:
-                    continue
-                L = len(seq)
-                cur += L
-                total_bp += L
-                n_count += seq.count("N")
-        if cur:
-            contig_lengths.append(cur)
+    # FASTA parsing is CPU-bound, so --workers > 1 spreads it across processes;
+    # results come back in file order either way
+    if args.workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            stats = list(pool.map(_fasta_stats, files, chunksize=max(1, len(files) // (args.workers * 4))))
+    else:
+        stats = map(_fasta_stats, files)
+
+    for fp, (contig_lengths, total_bp, n_count) in zip(files, stats):
 
         contigs = len(contig_lengths)
         contig_counter[contigs] += 1
@@ -470,7 +654,7 @@ def cmd_qc_genomes(args):
             }
         )
         if ready:
-            shutil.copy2(fp, ready_dir / fp.name)
+            _copy_if_changed(fp, ready_dir / fp.name)
 
     out_csv.parent.mkdir(parents=True, exist_ok=True)
     with out_csv.open("w", newline="", encoding="utf-8") as f:
@@ -479,19 +663,20 @@ def cmd_qc_genomes(args):
         w.writerows(rows)
 
     q = Counter(r["quality"] for r in rows)
-    print("=" * 60)
-    print(f"Analyzed genomes: {len(rows)}")
-    print(f"Quality counts: good={q.get('good',0)} moderate={q.get('moderate',0)} poor={q.get('poor',0)}")
-    print(f"Extraction-ready genomes: {sum(r['extraction_ready'] for r in rows)}")
-    print(f"Summary written: {out_csv}")
-    print(f"Extraction-ready folder: {ready_dir}")
-    print("=" * 60)
+    _print_summary(
+        f"Analyzed genomes: {len(rows)}",
+        f"Quality counts: good={q.get('good',0)} moderate={q.get('moderate',0)} poor={q.get('poor',0)}",
+        f"Extraction-ready genomes: {sum(r['extraction_ready'] for r in rows)}",
+        f"Summary written: {out_csv}",
+        f"Extraction-ready folder: {ready_dir}",
+    )
 
 
 def cmd_presentation_plots(args):
     import matplotlib.pyplot as plt
     import networkx as nx
     import numpy as np
+    import pandas as pd
     import seaborn as sns
     from matplotlib.patches import Patch
 
@@ -559,13 +744,14 @@ def cmd_presentation_plots(args):
         if not required.issubset(df.columns):
             print("[WARN] Epistasis CSV missing required columns; skipping graph content.")
             return g, node_freq, edge_w
-        for _, row in df.iterrows():
-            n1 = str(row.get("Node_1", "")).strip()
-            n2 = str(row.get("Node_2", "")).strip()
+        # Column-wise zip keeps row order (and so the seeded layout) without building a Series per row
+        for n1, n2, freq, score in zip(df["Node_1"], df["Node_2"], df["Frequency"], df["Composite_Network_Score"]):
+            n1 = str(n1).strip()
+            n2 = str(n2).strip()
             if not n1 or not n2:
                 continue
-            freq = float(row.get("Frequency", 0) or 0)
-            score = float(row.get("Composite_Network_Score", 0) or 0)
+            freq = float(freq or 0)
+            score = float(score or 0)
             g.add_edge(n1, n2)
             node_freq[n1] = node_freq.get(n1, 0.0) + freq
             node_freq[n2] = node_freq.get(n2, 0.0) + freq
@@ -579,18 +765,17 @@ def cmd_presentation_plots(args):
         needed = {"Node_1", "Node_2", "Frequency"}
         if not needed.issubset(epi_df.columns):
             return pd.DataFrame(columns=["mutation", "frequency", "gene", "gene_class"])
-        rows = []
-        for _, row in epi_df.iterrows():
-            freq = float(row.get("Frequency", 0) or 0)
-            for col in ("Node_1", "Node_2"):
-                mut = str(row.get(col, "")).strip()
-                if not mut:
-                    continue
-                gene = parse_gene(mut)
-                rows.append({"mutation": mut, "frequency": freq, "gene": gene, "gene_class": classify(gene)})
-        if not rows:
+        # Stack both node columns with one concat instead of growing a list of per-row dicts
+        freq = epi_df["Frequency"].map(lambda v: float(v or 0))
+        out = pd.concat(
+            [pd.DataFrame({"mutation": epi_df[col].map(str).str.strip(), "frequency": freq}) for col in ("Node_1", "Node_2")],
+            ignore_index=True,
+        )
+        out = out[out["mutation"] != ""]
+        if out.empty:
             return pd.DataFrame(columns=["mutation", "frequency", "gene", "gene_class"])
-        out = pd.DataFrame(rows)
+        out["gene"] = out["mutation"].map(parse_gene)
+        out["gene_class"] = out["gene"].map(classify)
         out = out.groupby(["mutation", "gene", "gene_class"])["frequency"].sum().reset_index()
         return out.sort_values(by=["frequency"], ascending=[False])
 
@@ -618,13 +803,20 @@ def cmd_presentation_plots(args):
             return "NearZero_DDG"
         return "Shift_or_Other"
 
+    def load_run(run_name):
+        run_dir = base_output_dir / run_name
+        return (
+            safe_read_csv(run_dir / "2_epistasis_networks.csv"),
+            load_biophysics(run_dir / "3_biophysics_docking.csv", run_name),
+        )
+
+    # Per-run CSV reads are independent, so overlap them; map keeps the runs in order
     epistasis_by_run = {}
     biophysics_frames = []
-    for run_name in runs:
-        run_dir = base_output_dir / run_name
-        _ = safe_read_csv(run_dir / "1_genomics_report.csv")
-        epistasis_by_run[run_name] = safe_read_csv(run_dir / "2_epistasis_networks.csv")
-        biophysics_frames.append(load_biophysics(run_dir / "3_biophysics_docking.csv", run_name))
+    with ThreadPoolExecutor(max_workers=max(1, min(len(runs), 8))) as pool:
+        for run_name, (epistasis_df, biophysics_df) in zip(runs, pool.map(load_run, runs)):
+            epistasis_by_run[run_name] = epistasis_df
+            biophysics_frames.append(biophysics_df)
 
     biophysics_all = pd.concat(biophysics_frames, ignore_index=True) if biophysics_frames else pd.DataFrame()
 
@@ -750,6 +942,7 @@ def build_parser():
     d.add_argument("--failed-log", default="failed_rest_api_ids.txt")
     d.add_argument("--missing-log", default="missing_after_rest_api.txt")
     d.add_argument("--api-limit", type=int, default=5000)
+    d.add_argument("--max-rps", type=float, default=3, help="Max requests per second across threads (0 = unlimited)")
     d.set_defaults(func=cmd_download_rest)
 
     m = sp.add_parser("fetch-metadata", help="Fetch BV-BRC genome metadata and enrich CSV")
@@ -762,6 +955,8 @@ def build_parser():
     m.add_argument("--timeout", type=int, default=45)
     m.add_argument("--retries", type=int, default=3)
     m.add_argument("--sleep-seconds", type=float, default=0.1)
+    m.add_argument("--cache-dir", default=None)
+    m.add_argument("--max-rps", type=float, default=0, help="Max requests per second (0 = unlimited)")
     m.set_defaults(func=cmd_fetch_metadata)
 
     g = sp.add_parser("geospatial-matrix", help="Build regulatory geospatial mutation matrix")
@@ -794,6 +989,7 @@ def build_parser():
     q.add_argument("--ready-max-contigs", type=int, default=300)
     q.add_argument("--ready-min-n50", type=int, default=50_000)
     q.add_argument("--ready-max-n-fraction", type=float, default=0.01)
+    q.add_argument("--workers", type=int, default=1, help="Processes used to parse FASTA files (default 1)")
     q.set_defaults(func=cmd_qc_genomes)
 
     pz = sp.add_parser("presentation-plots", help="Generate comparative presentation plots")